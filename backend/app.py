@@ -11,6 +11,7 @@ from config import create_bots
 
 main_bot, summary_bot = create_bots()
 controller = Controller(main_bot, summary_bot)
+orchestrator = Orchestrator(main_bot)   # built once and reused across requests
 
 app = FastAPI(title="Synovian Voice Chat")
 
@@ -29,7 +30,6 @@ async def chat_endpoint(request: Request):
     user_input = data.get("text", "").strip()
     print(f"\n🗣️ User said: {user_input}\n")
 
-    orchestrator = Orchestrator(main_bot)
     plan = orchestrator.plan(user_input)
     print("📜 Plan:", plan)
 
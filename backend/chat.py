@@ -2,7 +2,7 @@
 import sys
 from datetime import datetime
 from utils.memory import add_message, trim_history
-from utils.logger import append_txt, append_json_with_summary
+from utils.logger import append_txt, append_json_with_summary, append_summary
 
 def timestamp():
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -77,9 +77,7 @@ Conversation to analyze:
                 append_json_with_summary(history, summary_text)
 
                 # Also store separately in summaries.txt
-                with open("chat_logs/session_summaries.txt", "a", encoding="utf-8") as f:
-                    f.write(f"\n=== Summary ({session_time}) ===\n")
-                    f.write(summary_text + "\n" + "-" * 70 + "\n")
+                append_summary(session_time, summary_text)
 
             except Exception as e:
                 print(f"⚠️ Could not generate summary: {e}\n")
@@ -2,4 +2,5 @@
 ENABLE_MEMORY = False       # controls query/update/summary behaviors
 ENABLE_JSON_LOG = False     # chat_log.json writing
 ENABLE_SUMMARIES = False    # session_summaries.txt generation
-ENABLE_WEB_SEARCH = False   # web search functionality
\ No newline at end of file
+ENABLE_WEB_SEARCH = False   # web search functionality
+ENABLE_LOG_ROTATION = True  # rotate chat_logs/* into compressed archive segments
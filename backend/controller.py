@@ -1,4 +1,3 @@
-import os
 from config_flags import ENABLE_MEMORY, ENABLE_JSON_LOG, ENABLE_SUMMARIES
 from utils.memory import add_message
 from utils.logger import append_txt
@@ -138,7 +137,7 @@ class Controller:
             return
 
         from datetime import datetime
-        from utils.logger import append_json_with_summary
+        from utils.logger import append_json_with_summary, append_summary
 
         if not history:
             print("💾 Nothing to save — empty session.")
@@ -164,10 +163,7 @@ class Controller:
                 summary_text = f"[Summary generation error: {e}]"
 
             # Append to text summary file
-            os.makedirs("chat_logs", exist_ok=True)
-            with open(os.path.join("chat_logs", "session_summaries.txt"), "a", encoding="utf-8") as f:
-                f.write(f"\n=== Summary ({session_time}) ===\n")
-                f.write(summary_text + "\n" + "-" * 70 + "\n")
+            append_summary(session_time, summary_text)
 
         # Append JSON only if json logging enabled
         if ENABLE_JSON_LOG:
@@ -3,58 +3,58 @@ import re
 import google.generativeai as genai
 
 # ============================================================
-#  SYSTEM PROMPT — STRICT JSON MODE + END-WITH-COMMUNICATION
+#  ACTION SCHEMA — compact encoding sent to the planner
 # ============================================================
-SYSTEM_PROMPT = """
-You are Orchestrator — a control-plane agent that decides how a multi-bot AI system
-should handle user requests. You never perform the tasks yourself; you only create
-a structured plan of actions in valid JSON.
-
-Your objectives:
-1. Parse the user's input.
-2. Break it into one or more ordered steps.
-3. Each step must include:
-   • action — operation type.
-   • reason — one-sentence justification.
-   • confidence — float between 0 and 1.
-   • details — fine-grained parameters for that action.
-
-Recognized actions and expected detail keys:
-
-- send_to_main_chat → details: { "topic": "<topic of conversation>", "style": "<concise|friendly|explanatory|creative>" }
-- query_memory → details: { "section": "<memory category>", "query": "<specific info to recall>" }
-- update_memory → details: { "section": "<where to store>", "data": "<what to store>" }
-- summarize_session → details: { "scope": "<entire_session|last_task|errors_only>", "format": "<text|bullet|json>" }
-- web_search → details: { "query": "<search string>", "goal": "<why this search matters>" }
-- analyze_data → details: { "file_type": "<csv|txt|image>", "analysis_goal": "<goal>" }
-- generate_plan → details: { "objective": "<goal to plan for>", "steps_required": "<approx number of steps>" }
-- clarify_context → details: { "questions": ["list of clarifying questions"] }
-- run_code → details: { "language": "<python|javascript|other>", "task": "<what to compute>" }
-- idle → details: { "note": "small talk or no action needed" }
+# action -> detail keys ("key:a|b" lists allowed values, "key[]" is a list,
+# "key(...)" is a short gloss of what the value should contain)
+ACTION_SCHEMA = {
+    "send_to_main_chat": "topic(topic of conversation),style:concise|friendly|explanatory|creative",
+    "query_memory": "section(memory category),query(specific info to recall)",
+    "update_memory": "section(where to store),data(what to store)",
+    "summarize_session": "scope:entire_session|last_task|errors_only,format:text|bullet|json",
+    "web_search": "query(search string),goal(why this search matters)",
+    "analyze_data": "file_type:csv|txt|image,analysis_goal(goal)",
+    "generate_plan": "objective(goal to plan for),steps_required(approx number of steps)",
+    "clarify_context": "questions[](clarifying questions)",
+    "run_code": "language:python|javascript|other,task(what to compute)",
+    "idle": "note(small talk or no action needed)",
+}
 
-Output Format Rules:
-- Respond ONLY with a valid JSON object.
-- No code fences, no prose, no explanations.
-- The first character of your response must be '{' and the last must be '}'.
-- Always end the plan with a communication step ("send_to_main_chat" or "clarify_context").
-- If uncertain, still return a valid JSON object:
-  {"steps":[{"action":"clarify_context","reason":"unclear","confidence":0.0,"details":{"questions":["Could you rephrase that?"]}}]}
-"""
+# ============================================================
+#  SYSTEM PROMPT — STRICT JSON MODE + END-WITH-COMMUNICATION
+# ============================================================
+SYSTEM_PROMPT = (
+    "You are Orchestrator, a control-plane planner for a multi-bot system. "
+    "Never do the task; output only a JSON plan. Parse the user's input and "
+    "split it into one or more ordered steps.\n"
+    'OUT: {"steps":[{"action":str,"reason":str(1 sentence),"confidence":0..1,"details":{}}]}\n'
+    "ACTIONS (action: detail keys; a|b = allowed values; k[] = list; (..) = meaning):\n"
+    + "\n".join(f"{name}: {keys}" for name, keys in ACTION_SCHEMA.items())
+    + "\nRULES: JSON object only, no fences/prose; first char '{', last '}'; "
+    "order steps; last step must be send_to_main_chat or clarify_context.\n"
+    'IF UNSURE: {"steps":[{"action":"clarify_context","reason":"unclear","confidence":0.0,'
+    '"details":{"questions":["Could you rephrase that?"]}}]}'
+)
 
 # ============================================================
 #  ORCHESTRATOR CLASS
 # ============================================================
 class Orchestrator:
     def __init__(self, model):
-        # configure model (force low temperature for deterministic JSON)
+        # configure model (force low temperature for deterministic JSON);
+        # the system prompt is bound once as the system instruction instead
+        # of being concatenated onto every user turn
         self.model = genai.GenerativeModel(
             model.model_name,
+            system_instruction=SYSTEM_PROMPT,
             generation_config={"temperature": 0}
         )
+        self.last_usage = {}
 
     def plan(self, user_input: str):
         """Generate and safely parse a JSON action plan from user input."""
-        prompt = SYSTEM_PROMPT + f"\nUser: {user_input}"
+        prompt = f"User: {user_input}"
+        self.last_usage = {}
 
         try:
             response = self.model.generate_content(prompt)
@@ -63,6 +63,8 @@ class Orchestrator:
             print(f"⚠️ Model error: {e}")
             return self._fallback_plan("Model generation error")
 
+        self._record_usage(response)
+
         # --- Debug print (optional) ---
         # print("🧩 Raw orchestrator output:\n", raw_text)
 
@@ -76,6 +78,26 @@ class Orchestrator:
 
         return plan
 
+    # --------------------------------------------------------
+    # Per-turn planner token usage
+    # --------------------------------------------------------
+    def _record_usage(self, response):
+        """Store and print per-turn planner token usage."""
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            self.last_usage = {}
+            return
+        self.last_usage = {
+            "input_tokens": getattr(usage, "prompt_token_count", 0) or 0,
+            "cached_tokens": getattr(usage, "cached_content_token_count", 0) or 0,
+            "output_tokens": getattr(usage, "candidates_token_count", 0) or 0,
+        }
+        print(
+            f"📊 Planner tokens: input={self.last_usage['input_tokens']} "
+            f"(cached={self.last_usage['cached_tokens']}) "
+            f"output={self.last_usage['output_tokens']}"
+        )
+
     # --------------------------------------------------------
     # Internal helper: regex-based JSON extraction
     # --------------------------------------------------------
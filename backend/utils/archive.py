@@ -0,0 +1,243 @@
+# utils/archive.py
+import gzip
+import json
+import os
+import re
+from datetime import datetime, timedelta
+
+from config_flags import ENABLE_LOG_ROTATION
+
+LOG_DIR = "chat_logs"
+ARCHIVE_DIR = os.path.join(LOG_DIR, "archive")
+MANIFEST_PATH = os.path.join(ARCHIVE_DIR, "manifest.json")
+
+# ===========================================================
+# Rotation / retention policy
+# ===========================================================
+MAX_ACTIVE_BYTES = 512 * 1024   # rotate an active log once it grows past this
+MAX_ACTIVE_AGE_DAYS = 30        # ...or once its oldest entry is older than this
+RETENTION_DAYS = None           # days to keep archived segments (None = keep forever)
+BUCKET_FORMAT = "%Y-%m"         # one segment per source per month
+
+TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+TS_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+
+# Headers that open a dated block in each text log
+BLOCK_HEADERS = {
+    "chat_log.txt": re.compile(r"^=== Session Start \[(.+?)\] ===$", re.M),
+    "session_summaries.txt": re.compile(r"^=== Summary \((.+?)\) ===$", re.M),
+}
+
+
+def parse_ts(text):
+    """Parse the first 'YYYY-MM-DD HH:MM:SS' found in text. Returns datetime or None."""
+    match = TS_PATTERN.search(text or "")
+    if not match:
+        return None
+    return datetime.strptime(match.group(0), TS_FORMAT)
+
+
+# ===========================================================
+# Manifest
+# ===========================================================
+
+def load_manifest():
+    """Return the list of archived segment records (empty if none)."""
+    if not os.path.exists(MANIFEST_PATH):
+        return []
+    with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+        try:
+            return json.load(f)
+        except json.JSONDecodeError:
+            return []
+
+def _save_manifest(manifest):
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+# ===========================================================
+# Splitting active logs into dated entries
+# ===========================================================
+
+def _split_entries(source, content):
+    """Split a log's content into [(datetime|None, entry)] in file order."""
+    if source.endswith(".json"):
+        try:
+            sessions = json.loads(content) if content.strip() else []
+        except json.JSONDecodeError:
+            return []
+        return [(parse_ts(s.get("timestamp", "")), s) for s in sessions]
+
+    header = BLOCK_HEADERS.get(source)
+    starts = [m.start() for m in header.finditer(content)] if header else []
+    if not starts:
+        return [(parse_ts(content), content)] if content.strip() else []
+
+    # any preamble before the first header stays with the first block
+    starts[0] = 0
+    bounds = starts + [len(content)]
+    return [
+        (parse_ts(content[bounds[i]:bounds[i + 1]]), content[bounds[i]:bounds[i + 1]])
+        for i in range(len(starts))
+    ]
+
+def _segment_name(source, bucket, seq):
+    stem, ext = os.path.splitext(source)
+    return f"{stem}.{bucket}.{seq}{ext}.gz"
+
+def _next_segment_name(manifest, source, bucket):
+    """Pick a segment name for source/bucket that no record or file uses yet."""
+    used = {s["file"] for s in manifest}
+    seq = 0
+    while True:
+        name = _segment_name(source, bucket, seq)
+        if name not in used and not os.path.exists(os.path.join(ARCHIVE_DIR, name)):
+            return name
+        seq += 1
+
+
+# ===========================================================
+# Rotation
+# ===========================================================
+
+def rotate_if_needed(path):
+    """Rotate an active log into the archive if it is too large or too old."""
+    if not ENABLE_LOG_ROTATION or not os.path.exists(path):
+        return False
+
+    if os.path.getsize(path) > MAX_ACTIVE_BYTES:
+        return rotate(path)
+
+    # the oldest entry is near the top of the file — no need to read it all
+    with open(path, "r", encoding="utf-8") as f:
+        oldest = parse_ts(f.read(4096))
+    if oldest and datetime.now() - oldest > timedelta(days=MAX_ACTIVE_AGE_DAYS):
+        return rotate(path)
+    return False
+
+def rotate(path):
+    """Move an active log into gzip segments bucketed by month, then empty it."""
+    source = os.path.basename(path)
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    entries = _split_entries(source, content)
+    if not entries:
+        return False
+
+    fallback_ts = datetime.fromtimestamp(os.path.getmtime(path))
+    buckets = {}
+    for ts, entry in entries:
+        ts = ts or fallback_ts
+        buckets.setdefault(ts.strftime(BUCKET_FORMAT), []).append((ts, entry))
+
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    manifest = load_manifest()
+    for bucket, items in sorted(buckets.items()):
+        name = _next_segment_name(manifest, source, bucket)
+        seg_path = os.path.join(ARCHIVE_DIR, name)
+        with gzip.open(seg_path, "wt", encoding="utf-8") as f:
+            if source.endswith(".json"):
+                json.dump([e for _, e in items], f, ensure_ascii=False)
+            else:
+                f.write("".join(e for _, e in items))
+        stamps = [ts for ts, _ in items]
+        manifest.append({
+            "source": source,
+            "file": name,
+            "bucket": bucket,
+            "start": min(stamps).strftime(TS_FORMAT),
+            "end": max(stamps).strftime(TS_FORMAT),
+            "entries": len(items),
+            "bytes": os.path.getsize(seg_path),
+        })
+
+    # manifest first, then remove, so a crash never loses entries
+    _save_manifest(manifest)
+    os.remove(path)
+    apply_retention()
+    return True
+
+def apply_retention(now=None):
+    """Delete archived segments whose newest entry is past RETENTION_DAYS."""
+    if RETENTION_DAYS is None:
+        return 0
+    cutoff = (now or datetime.now()) - timedelta(days=RETENTION_DAYS)
+    manifest = load_manifest()
+    keep = [s for s in manifest if datetime.strptime(s["end"], TS_FORMAT) >= cutoff]
+    expired = [s for s in manifest if s not in keep]
+    if not expired:
+        return 0
+
+    # manifest first, then delete files no kept record still references
+    _save_manifest(keep)
+    kept_files = {s["file"] for s in keep}
+    for seg in expired:
+        seg_path = os.path.join(ARCHIVE_DIR, seg["file"])
+        if seg["file"] not in kept_files and os.path.exists(seg_path):
+            os.remove(seg_path)
+    return len(expired)
+
+
+# ===========================================================
+# Search across active + archived entries
+# ===========================================================
+
+def _in_range(ts, since, until):
+    if ts is None:
+        return since is None and until is None
+    return (since is None or ts >= since) and (until is None or ts <= until)
+
+def _drop_records(files):
+    """Remove manifest records whose segment files are gone."""
+    manifest = load_manifest()
+    _save_manifest([s for s in manifest if s["file"] not in files])
+
+def has_entries(path):
+    """True if the active log or any archived segment exists for it."""
+    source = os.path.basename(path)
+    return os.path.exists(path) or any(s["source"] == source for s in load_manifest())
+
+def segments(source, since=None, until=None):
+    """Manifest records for source overlapping [since, until], newest first."""
+    picked = []
+    for seg in load_manifest():
+        if seg["source"] != source:
+            continue
+        if since and datetime.strptime(seg["end"], TS_FORMAT) < since:
+            continue
+        if until and datetime.strptime(seg["start"], TS_FORMAT) > until:
+            continue
+        picked.append(seg)
+    return sorted(picked, key=lambda s: s["end"], reverse=True)
+
+def iter_entries(path, since=None, until=None):
+    """
+    Yield (datetime|None, entry) from the active log and then its archived
+    segments, newest first. Segments outside [since, until] are never opened.
+    Entries are text blocks for .txt logs and session dicts for .json logs.
+    """
+    source = os.path.basename(path)
+
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            active = _split_entries(source, f.read())
+        for ts, entry in reversed(active):
+            if _in_range(ts, since, until):
+                yield ts, entry
+
+    for seg in segments(source, since, until):
+        seg_path = os.path.join(ARCHIVE_DIR, seg["file"])
+        if not os.path.exists(seg_path):
+            print(f"⚠️ Archived segment missing, dropping from manifest: {seg['file']} "
+                  f"({seg['start']} – {seg['end']}, {seg['entries']} entries)")
+            _drop_records({seg["file"]})
+            continue
+        with gzip.open(seg_path, "rt", encoding="utf-8") as f:
+            archived = _split_entries(source, f.read())
+        for ts, entry in reversed(archived):
+            if _in_range(ts, since, until):
+                yield ts, entry
@@ -2,18 +2,21 @@
 import os
 import json
 from datetime import datetime
+from utils.archive import rotate_if_needed
 
 LOG_DIR = "chat_logs"
 os.makedirs(LOG_DIR, exist_ok=True)
 
 TXT_LOG_PATH = os.path.join(LOG_DIR, "chat_log.txt")
 JSON_LOG_PATH = os.path.join(LOG_DIR, "chat_log.json")
+SUMMARIES_PATH = os.path.join(LOG_DIR, "session_summaries.txt")
 
 def timestamp():
     return datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
 
 def append_txt(history):
     """Append one session to the ongoing text log."""
+    rotate_if_needed(TXT_LOG_PATH)
     with open(TXT_LOG_PATH, "a", encoding="utf-8") as f:
         f.write("\n\n=== Session Start " + timestamp() + " ===\n\n")
         for entry in history:
@@ -36,8 +39,16 @@ def append_json_with_summary(history, summary_text):
     }
     _append_to_json_file(session_data)
 
+def append_summary(session_time, summary_text):
+    """Append a structured session summary to session_summaries.txt."""
+    rotate_if_needed(SUMMARIES_PATH)
+    with open(SUMMARIES_PATH, "a", encoding="utf-8") as f:
+        f.write(f"\n=== Summary ({session_time}) ===\n")
+        f.write(summary_text + "\n" + "-" * 70 + "\n")
+
 def _append_to_json_file(session_data):
     """Private helper to append structured session data."""
+    rotate_if_needed(JSON_LOG_PATH)
     existing = []
     if os.path.exists(JSON_LOG_PATH):
         with open(JSON_LOG_PATH, "r", encoding="utf-8") as f:
@@ -1,7 +1,7 @@
 # utils/memory.py
-import json
 import os
 from datetime import datetime
+from utils.archive import TS_FORMAT, has_entries, iter_entries
 
 LOG_DIR = "chat_logs"
 JSON_LOG_PATH = os.path.join(LOG_DIR, "chat_log.json")
@@ -26,41 +26,43 @@ def trim_history(history, max_turns=12):
 # Memory Retrieval Layer
 # ===========================================================
 
-def load_memory():
-    """Load JSON chat memory. Returns list of sessions."""
-    if not os.path.exists(JSON_LOG_PATH):
-        return []
-    with open(JSON_LOG_PATH, "r", encoding="utf-8") as f:
-        try:
-            return json.load(f)
-        except json.JSONDecodeError:
-            return []
+def load_memory(since=None, until=None):
+    """
+    Load JSON chat memory from the active log and archived segments.
+    Returns list of sessions, oldest first. since/until (datetime) prune
+    archived segments by time range.
+    """
+    sessions = [s for _, s in iter_entries(JSON_LOG_PATH, since, until)]
+    sessions.reverse()
+    return sessions
 
-def retrieve_from_memory(query: str, section: str = None, limit: int = 3):
+def retrieve_from_memory(query: str, section: str = None, limit: int = 3,
+                         since=None, until=None):
     """
-    Bare-bones keyword search through session_summaries.txt.
-    Returns up to <limit> matching excerpts.
+    Bare-bones keyword search through session_summaries.txt and its archives.
+    Searches newest summaries first and stops after <limit> matching excerpts,
+    so older archived segments are only opened when needed.
     """
-    summaries_path = os.path.join("chat_logs", "session_summaries.txt")
-    if not os.path.exists(summaries_path):
+    if not has_entries(SUMMARIES_PATH):
         return [{"timestamp": None, "match": "[No memory file found]"}]
 
     results = []
-    with open(summaries_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    joined = "".join(lines)
-    lower = joined.lower()
-    idx = 0
-    while True:
-        pos = lower.find(query.lower(), idx)
-        if pos == -1 or len(results) >= limit:
+    needle = query.lower()
+    for ts, block in iter_entries(SUMMARIES_PATH, since, until):
+        lower = block.lower()
+        idx = 0
+        while len(results) < limit:
+            pos = lower.find(needle, idx)
+            if pos == -1:
+                break
+            start = max(0, pos - 200)
+            end = min(len(block), pos + 200)
+            snippet = block[start:end].strip().replace("\n", " ")
+            stamp = ts.strftime(TS_FORMAT) if ts else None
+            results.append({"timestamp": stamp, "match": snippet + "..."})
+            idx = pos + len(query)
+        if len(results) >= limit:
             break
-        start = max(0, pos - 200)
-        end = min(len(joined), pos + 200)
-        snippet = joined[start:end].strip().replace("\n", " ")
-        results.append({"timestamp": None, "match": snippet + "..."})
-        idx = pos + len(query)
 
     if not results:
         return [{"timestamp": None, "match": "[No matching memory found]"}]